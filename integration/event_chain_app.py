@@ -0,0 +1,332 @@
+"""The EventChain app and the event orders its buttons are expected to record."""
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+# number of events yielded by the yield_many_events button, the app harness CI
+# job raises it with REFLEX_MANY_EVENTS=50
+MANY_EVENTS = int(os.environ.get("REFLEX_MANY_EVENTS", "8"))
+
+
+def EventChain():
+    """App with chained event handlers."""
+    import asyncio
+    import os
+    import time
+
+    import reflex as rx
+
+    # repeated here since the outer global isn't exported into the App module
+    MANY_EVENTS = int(os.environ.get("REFLEX_MANY_EVENTS", "8"))
+
+    class State(rx.State):
+        event_order: list[str] = []
+        interim_value: str = ""
+
+        def event_no_args(self):
+            self.event_order.append("event_no_args")
+
+        def event_arg(self, arg):
+            self.event_order.append(f"event_arg:{arg}")
+
+        def event_arg_repr_type(self, arg):
+            self.event_order.append(f"event_arg_repr:{arg!r}_{type(arg).__name__}")
+
+        def event_nested_1(self):
+            self.event_order.append("event_nested_1")
+            yield State.event_nested_2
+            yield State.event_arg("nested_1")  # type: ignore
+
+        def event_nested_2(self):
+            self.event_order.append("event_nested_2")
+            yield State.event_nested_3
+            yield rx.console_log("event_nested_2")
+            yield State.event_arg("nested_2")  # type: ignore
+
+        def event_nested_3(self):
+            self.event_order.append("event_nested_3")
+            yield State.event_no_args
+            yield State.event_arg("nested_3")  # type: ignore
+
+        def on_load_return_chain(self):
+            self.event_order.append("on_load_return_chain")
+            return [State.event_arg(1), State.event_arg(2), State.event_arg(3)]  # type: ignore
+
+        def on_load_yield_chain(self):
+            self.event_order.append("on_load_yield_chain")
+            yield State.event_arg(4)  # type: ignore
+            yield State.event_arg(5)  # type: ignore
+            yield State.event_arg(6)  # type: ignore
+
+        def click_return_event(self):
+            self.event_order.append("click_return_event")
+            return State.event_no_args
+
+        def click_return_events(self):
+            self.event_order.append("click_return_events")
+            return [
+                State.event_arg(7),  # type: ignore
+                rx.console_log("click_return_events"),
+                State.event_arg(8),  # type: ignore
+                State.event_arg(9),  # type: ignore
+            ]
+
+        def click_yield_chain(self):
+            self.event_order.append("click_yield_chain:0")
+            yield State.event_arg(10)  # type: ignore
+            self.event_order.append("click_yield_chain:1")
+            yield rx.console_log("click_yield_chain")
+            yield State.event_arg(11)  # type: ignore
+            self.event_order.append("click_yield_chain:2")
+            yield State.event_arg(12)  # type: ignore
+            self.event_order.append("click_yield_chain:3")
+
+        def click_yield_many_events(self):
+            self.event_order.append("click_yield_many_events")
+            for ix in range(MANY_EVENTS):
+                yield State.event_arg(ix)  # type: ignore
+                yield rx.console_log(f"many_events_{ix}")
+            self.event_order.append("click_yield_many_events_done")
+
+        def click_yield_nested(self):
+            self.event_order.append("click_yield_nested")
+            yield State.event_nested_1
+            yield State.event_arg("yield_nested")  # type: ignore
+
+        def redirect_return_chain(self):
+            self.event_order.append("redirect_return_chain")
+            yield rx.redirect("/on-load-return-chain")
+
+        def redirect_yield_chain(self):
+            self.event_order.append("redirect_yield_chain")
+            yield rx.redirect("/on-load-yield-chain")
+
+        def click_return_int_type(self):
+            self.event_order.append("click_return_int_type")
+            return State.event_arg_repr_type(1)  # type: ignore
+
+        def click_return_dict_type(self):
+            self.event_order.append("click_return_dict_type")
+            return State.event_arg_repr_type({"a": 1})  # type: ignore
+
+        async def click_yield_interim_value_async(self):
+            self.interim_value = "interim"
+            yield
+            await asyncio.sleep(0.5)
+            self.interim_value = "final"
+
+        def click_yield_interim_value(self):
+            self.interim_value = "interim"
+            yield
+            time.sleep(0.5)
+            self.interim_value = "final"
+
+    app = rx.App(state=rx.State)
+
+    def token_input():
+        return rx.chakra.input(
+            value=State.router.session.client_token, is_read_only=True, id="token"
+        )
+
+    @app.add_page
+    def index():
+        return rx.fragment(
+            token_input(),
+            rx.chakra.input(
+                value=State.interim_value, is_read_only=True, id="interim_value"
+            ),
+            rx.button(
+                "Return Event",
+                id="return_event",
+                on_click=State.click_return_event,
+            ),
+            rx.button(
+                "Return Events",
+                id="return_events",
+                on_click=State.click_return_events,
+            ),
+            rx.button(
+                "Yield Chain",
+                id="yield_chain",
+                on_click=State.click_yield_chain,
+            ),
+            rx.button(
+                "Yield Many events",
+                id="yield_many_events",
+                on_click=State.click_yield_many_events,
+            ),
+            rx.button(
+                "Yield Nested",
+                id="yield_nested",
+                on_click=State.click_yield_nested,
+            ),
+            rx.button(
+                "Redirect Yield Chain",
+                id="redirect_yield_chain",
+                on_click=State.redirect_yield_chain,
+            ),
+            rx.button(
+                "Redirect Return Chain",
+                id="redirect_return_chain",
+                on_click=State.redirect_return_chain,
+            ),
+            rx.button(
+                "Click Int Type",
+                id="click_int_type",
+                on_click=lambda: State.event_arg_repr_type(1),  # type: ignore
+            ),
+            rx.button(
+                "Click Dict Type",
+                id="click_dict_type",
+                on_click=lambda: State.event_arg_repr_type({"a": 1}),  # type: ignore
+            ),
+            rx.button(
+                "Return Chain Int Type",
+                id="return_int_type",
+                on_click=State.click_return_int_type,
+            ),
+            rx.button(
+                "Return Chain Dict Type",
+                id="return_dict_type",
+                on_click=State.click_return_dict_type,
+            ),
+            rx.button(
+                "Click Yield Interim Value (Async)",
+                id="click_yield_interim_value_async",
+                on_click=State.click_yield_interim_value_async,
+            ),
+            rx.button(
+                "Click Yield Interim Value",
+                id="click_yield_interim_value",
+                on_click=State.click_yield_interim_value,
+            ),
+        )
+
+    def on_load_return_chain():
+        return rx.fragment(
+            rx.text("return"),
+            token_input(),
+        )
+
+    def on_load_yield_chain():
+        return rx.fragment(
+            rx.text("yield"),
+            token_input(),
+        )
+
+    def on_mount_return_chain():
+        return rx.fragment(
+            rx.text(
+                "return",
+                on_mount=State.on_load_return_chain,
+                on_unmount=lambda: State.event_arg("unmount"),  # type: ignore
+            ),
+            token_input(),
+            rx.button("Unmount", on_click=rx.redirect("/"), id="unmount"),
+        )
+
+    def on_mount_yield_chain():
+        return rx.fragment(
+            rx.text(
+                "yield",
+                on_mount=[
+                    State.on_load_yield_chain,
+                    lambda: State.event_arg("mount"),  # type: ignore
+                ],
+                on_unmount=State.event_no_args,
+            ),
+            token_input(),
+            rx.button("Unmount", on_click=rx.redirect("/"), id="unmount"),
+        )
+
+    app.add_page(on_load_return_chain, on_load=State.on_load_return_chain)  # type: ignore
+    app.add_page(on_load_yield_chain, on_load=State.on_load_yield_chain)  # type: ignore
+    app.add_page(on_mount_return_chain)
+    app.add_page(on_mount_yield_chain)
+
+
+def many_events_order() -> list[str]:
+    """Get the events expected after clicking the yield_many_events button.
+
+    Returns:
+        The expected events recorded in the State.
+    """
+    return [
+        "click_yield_many_events",
+        "click_yield_many_events_done",
+        *(f"event_arg:{ix}" for ix in range(MANY_EVENTS)),
+    ]
+
+
+CLICK_EVENT_ORDERS: list[tuple[str, Optional[list[str]]]] = [
+    ("return_event", ["click_return_event", "event_no_args"]),
+    (
+        "return_events",
+        ["click_return_events", "event_arg:7", "event_arg:8", "event_arg:9"],
+    ),
+    (
+        "yield_chain",
+        [
+            "click_yield_chain:0",
+            "click_yield_chain:1",
+            "click_yield_chain:2",
+            "click_yield_chain:3",
+            "event_arg:10",
+            "event_arg:11",
+            "event_arg:12",
+        ],
+    ),
+    # built by many_events_order() when the test runs
+    ("yield_many_events", None),
+    (
+        "yield_nested",
+        [
+            "click_yield_nested",
+            "event_nested_1",
+            "event_arg:yield_nested",
+            "event_nested_2",
+            "event_arg:nested_1",
+            "event_nested_3",
+            "event_arg:nested_2",
+            "event_no_args",
+            "event_arg:nested_3",
+        ],
+    ),
+    (
+        "redirect_return_chain",
+        [
+            "redirect_return_chain",
+            "on_load_return_chain",
+            "event_arg:1",
+            "event_arg:2",
+            "event_arg:3",
+        ],
+    ),
+    (
+        "redirect_yield_chain",
+        [
+            "redirect_yield_chain",
+            "on_load_yield_chain",
+            "event_arg:4",
+            "event_arg:5",
+            "event_arg:6",
+        ],
+    ),
+    (
+        "click_int_type",
+        ["event_arg_repr:1_int"],
+    ),
+    (
+        "click_dict_type",
+        ["event_arg_repr:{'a': 1}_dict"],
+    ),
+    (
+        "return_int_type",
+        ["click_return_int_type", "event_arg_repr:1_int"],
+    ),
+    (
+        "return_dict_type",
+        ["click_return_dict_type", "event_arg_repr:{'a': 1}_dict"],
+    ),
+]
@@ -1,271 +1,218 @@
 """Ensure that Event Chains are properly queued and handled between frontend and backend."""
-
-from typing import Generator
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Generator, Iterator, Optional
+from urllib.parse import urlsplit
 
 import pytest
 from selenium.webdriver.common.by import By
 
-from reflex.testing import AppHarness, WebDriver
-
-MANY_EVENTS = 50
-
-
-def EventChain():
-    """App with chained event handlers."""
-    import asyncio
-    import time
-
-    import reflex as rx
-
-    # repeated here since the outer global isn't exported into the App module
-    MANY_EVENTS = 50
-
-    class State(rx.State):
-        event_order: list[str] = []
-        interim_value: str = ""
-
-        def event_no_args(self):
-            self.event_order.append("event_no_args")
-
-        def event_arg(self, arg):
-            self.event_order.append(f"event_arg:{arg}")
-
-        def event_arg_repr_type(self, arg):
-            self.event_order.append(f"event_arg_repr:{arg!r}_{type(arg).__name__}")
-
-        def event_nested_1(self):
-            self.event_order.append("event_nested_1")
-            yield State.event_nested_2
-            yield State.event_arg("nested_1")  # type: ignore
-
-        def event_nested_2(self):
-            self.event_order.append("event_nested_2")
-            yield State.event_nested_3
-            yield rx.console_log("event_nested_2")
-            yield State.event_arg("nested_2")  # type: ignore
-
-        def event_nested_3(self):
-            self.event_order.append("event_nested_3")
-            yield State.event_no_args
-            yield State.event_arg("nested_3")  # type: ignore
-
-        def on_load_return_chain(self):
-            self.event_order.append("on_load_return_chain")
-            return [State.event_arg(1), State.event_arg(2), State.event_arg(3)]  # type: ignore
-
-        def on_load_yield_chain(self):
-            self.event_order.append("on_load_yield_chain")
-            yield State.event_arg(4)  # type: ignore
-            yield State.event_arg(5)  # type: ignore
-            yield State.event_arg(6)  # type: ignore
-
-        def click_return_event(self):
-            self.event_order.append("click_return_event")
-            return State.event_no_args
-
-        def click_return_events(self):
-            self.event_order.append("click_return_events")
-            return [
-                State.event_arg(7),  # type: ignore
-                rx.console_log("click_return_events"),
-                State.event_arg(8),  # type: ignore
-                State.event_arg(9),  # type: ignore
-            ]
-
-        def click_yield_chain(self):
-            self.event_order.append("click_yield_chain:0")
-            yield State.event_arg(10)  # type: ignore
-            self.event_order.append("click_yield_chain:1")
-            yield rx.console_log("click_yield_chain")
-            yield State.event_arg(11)  # type: ignore
-            self.event_order.append("click_yield_chain:2")
-            yield State.event_arg(12)  # type: ignore
-            self.event_order.append("click_yield_chain:3")
-
-        def click_yield_many_events(self):
-            self.event_order.append("click_yield_many_events")
-            for ix in range(MANY_EVENTS):
-                yield State.event_arg(ix)  # type: ignore
-                yield rx.console_log(f"many_events_{ix}")
-            self.event_order.append("click_yield_many_events_done")
-
-        def click_yield_nested(self):
-            self.event_order.append("click_yield_nested")
-            yield State.event_nested_1
-            yield State.event_arg("yield_nested")  # type: ignore
-
-        def redirect_return_chain(self):
-            self.event_order.append("redirect_return_chain")
-            yield rx.redirect("/on-load-return-chain")
-
-        def redirect_yield_chain(self):
-            self.event_order.append("redirect_yield_chain")
-            yield rx.redirect("/on-load-yield-chain")
-
-        def click_return_int_type(self):
-            self.event_order.append("click_return_int_type")
-            return State.event_arg_repr_type(1)  # type: ignore
-
-        def click_return_dict_type(self):
-            self.event_order.append("click_return_dict_type")
-            return State.event_arg_repr_type({"a": 1})  # type: ignore
-
-        async def click_yield_interim_value_async(self):
-            self.interim_value = "interim"
-            yield
-            await asyncio.sleep(0.5)
-            self.interim_value = "final"
+import reflex
+from reflex import constants
+from reflex.testing import AppHarness
+from reflex.utils import prerequisites
+
+from .event_chain_app import CLICK_EVENT_ORDERS, EventChain, many_events_order
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+
+    from reflex.state import BaseState
+    from reflex.testing import WebDriver
+
+EVENT_POLL_INTERVAL = 0.05
+TOKEN_POLL_INTERVAL = 0.025
+REDIRECT_POLL_INTERVAL = 0.02
+# opt-in directory for caching the compiled EventChain app between sessions
+COMPILED_APP_CACHE_ENV_VAR = "REFLEX_TEST_COMPILED_APP_CACHE"
+COMPILED_APP_CACHE_PREFIX = "event_chain-"
+
+
+def get_compiled_app_hash() -> str:
+    """Hash everything that the compiled EventChain app depends on.
+
+    Returns:
+        A hash of the EventChain source and the reflex package files.
+    """
+    sha = hashlib.sha1(inspect.getsource(EventChain).encode())
+    reflex_dir = Path(reflex.__file__).parent
+    for path in sorted(reflex_dir.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            sha.update(str(path.relative_to(reflex_dir)).encode())
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
 
-        def click_yield_interim_value(self):
-            self.interim_value = "interim"
-            yield
-            time.sleep(0.5)
-            self.interim_value = "final"
 
-    app = rx.App(state=rx.State)
+def get_cached_app() -> Optional[Path]:
+    """Get the cache entry for the compiled EventChain app.
 
-    token_input = rx.chakra.input(
-        value=State.router.session.client_token, is_read_only=True, id="token"
+    Caching is opt-in: set REFLEX_TEST_COMPILED_APP_CACHE to a directory used
+    only for this cache. Entries for older versions of the app are not evicted,
+    another session may still be running from them.
+
+    The hash does not cover node and bun, which `reflex init` installs under
+    ~/.reflex. A cached app skips `reflex init`, so the cache is not used until
+    node can be found.
+
+    Returns:
+        The cache entry path, or None when caching is disabled.
+    """
+    cache_dir = os.environ.get(COMPILED_APP_CACHE_ENV_VAR)
+    if not cache_dir or prerequisites.get_package_manager() is None:
+        return None
+    return Path(cache_dir) / f"{COMPILED_APP_CACHE_PREFIX}{get_compiled_app_hash()}"
+
+
+def restore_compiled_app(cached_app: Path, app_root: Path):
+    """Copy a cached app into app_root.
+
+    node_modules is linked to the cache entry rather than copied.
+
+    Args:
+        cached_app: the cache entry to restore.
+        app_root: the directory to restore the app into.
+    """
+    node_modules = Path(constants.Dirs.WEB) / constants.Next.NODE_MODULES
+    shutil.copytree(
+        cached_app,
+        app_root,
+        symlinks=True,
+        ignore=shutil.ignore_patterns(constants.Next.NODE_MODULES),
+        dirs_exist_ok=True,
+    )
+    (app_root / node_modules).symlink_to(
+        cached_app / node_modules, target_is_directory=True
     )
 
-    @app.add_page
-    def index():
-        return rx.fragment(
-            token_input,
-            rx.chakra.input(
-                value=State.interim_value, is_read_only=True, id="interim_value"
-            ),
-            rx.button(
-                "Return Event",
-                id="return_event",
-                on_click=State.click_return_event,
-            ),
-            rx.button(
-                "Return Events",
-                id="return_events",
-                on_click=State.click_return_events,
-            ),
-            rx.button(
-                "Yield Chain",
-                id="yield_chain",
-                on_click=State.click_yield_chain,
-            ),
-            rx.button(
-                "Yield Many events",
-                id="yield_many_events",
-                on_click=State.click_yield_many_events,
-            ),
-            rx.button(
-                "Yield Nested",
-                id="yield_nested",
-                on_click=State.click_yield_nested,
-            ),
-            rx.button(
-                "Redirect Yield Chain",
-                id="redirect_yield_chain",
-                on_click=State.redirect_yield_chain,
-            ),
-            rx.button(
-                "Redirect Return Chain",
-                id="redirect_return_chain",
-                on_click=State.redirect_return_chain,
-            ),
-            rx.button(
-                "Click Int Type",
-                id="click_int_type",
-                on_click=lambda: State.event_arg_repr_type(1),  # type: ignore
-            ),
-            rx.button(
-                "Click Dict Type",
-                id="click_dict_type",
-                on_click=lambda: State.event_arg_repr_type({"a": 1}),  # type: ignore
-            ),
-            rx.button(
-                "Return Chain Int Type",
-                id="return_int_type",
-                on_click=State.click_return_int_type,
-            ),
-            rx.button(
-                "Return Chain Dict Type",
-                id="return_dict_type",
-                on_click=State.click_return_dict_type,
-            ),
-            rx.button(
-                "Click Yield Interim Value (Async)",
-                id="click_yield_interim_value_async",
-                on_click=State.click_yield_interim_value_async,
-            ),
-            rx.button(
-                "Click Yield Interim Value",
-                id="click_yield_interim_value",
-                on_click=State.click_yield_interim_value,
-            ),
-        )
 
-    def on_load_return_chain():
-        return rx.fragment(
-            rx.text("return"),
-            token_input,
-        )
+def cache_compiled_app(app_root: Path, cached_app: Path):
+    """Copy an initialized and compiled app into the cache.
 
-    def on_load_yield_chain():
-        return rx.fragment(
-            rx.text("yield"),
-            token_input,
-        )
+    Caching is best effort, a failure is logged and the tests carry on. The copy
+    is staged next to the cache entry and renamed into place, so a partially
+    written entry is never used.
 
-    def on_mount_return_chain():
-        return rx.fragment(
-            rx.text(
-                "return",
-                on_mount=State.on_load_return_chain,
-                on_unmount=lambda: State.event_arg("unmount"),  # type: ignore
-            ),
-            token_input,
-            rx.button("Unmount", on_click=rx.redirect("/"), id="unmount"),
+    Args:
+        app_root: the directory containing the compiled app.
+        cached_app: the cache entry to create.
+    """
+    staging = None
+    try:
+        cached_app.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=cached_app.parent))
+        shutil.copytree(
+            app_root,
+            staging,
+            symlinks=True,
+            ignore=shutil.ignore_patterns(".next", "__pycache__"),
+            dirs_exist_ok=True,
         )
+        os.rename(staging, cached_app)
+    except OSError as err:
+        print(f"Not caching the compiled app in {cached_app}: {err}")
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
 
-    def on_mount_yield_chain():
-        return rx.fragment(
-            rx.text(
-                "yield",
-                on_mount=[
-                    State.on_load_yield_chain,
-                    lambda: State.event_arg("mount"),  # type: ignore
-                ],
-                on_unmount=State.event_no_args,
-            ),
-            token_input,
-            rx.button("Unmount", on_click=rx.redirect("/"), id="unmount"),
-        )
 
-    app.add_page(on_load_return_chain, on_load=State.on_load_return_chain)  # type: ignore
-    app.add_page(on_load_yield_chain, on_load=State.on_load_yield_chain)  # type: ignore
-    app.add_page(on_mount_return_chain)
-    app.add_page(on_mount_yield_chain)
+@contextmanager
+def cold_start_lock(tmp_path_factory) -> Iterator[None]:
+    """Hold a lock while the EventChain app is initialized and compiled.
+
+    pytest-xdist workers would otherwise run `reflex init` at the same time and
+    race on installing node and bun. The lock file is kept in the parent of the
+    basetemp, which every worker of the session shares.
+
+    Args:
+        tmp_path_factory: pytest tmp_path_factory fixture
+
+    Yields:
+        None
+    """
+    lock_path = tmp_path_factory.getbasetemp().parent / "event_chain.lock"
+    with open(lock_path, "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def start_event_chain(root: Path, cached_app: Optional[Path]) -> AppHarness:
+    """Start the EventChain app in root, from the cache when it is there.
+
+    Args:
+        root: the directory to start the app in.
+        cached_app: the cache entry for the app, None when caching is disabled.
+
+    Returns:
+        The running AppHarness instance.
+    """
+    is_cached = cached_app is not None and cached_app.exists()
+    if cached_app is not None and is_cached:
+        restore_compiled_app(cached_app, root)
+    harness = AppHarness.create(
+        root=root,
+        app_source=None if is_cached else EventChain,  # type: ignore
+        app_name=EventChain.__name__.lower(),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        if is_cached:
+            # only skip compiling this app, other harnesses may start later
+            mp.setenv(constants.SKIP_COMPILE_ENV_VAR, "yes")
+        harness.start()
+    if cached_app is not None and not is_cached:
+        cache_compiled_app(root, cached_app)
+    return harness
 
 
 @pytest.fixture(scope="session")
 def event_chain(tmp_path_factory) -> Generator[AppHarness, None, None]:
     """Start EventChain app at tmp_path via AppHarness.
 
+    When REFLEX_TEST_COMPILED_APP_CACHE is set, the initialized and compiled
+    app is cached in that directory, so later sessions skip `reflex init` and
+    compiling the app when neither the EventChain source nor reflex itself has
+    changed.
+
+    Under pytest-xdist each worker starts its own harness, on ports picked by
+    the OS. Starts that initialize the app hold `cold_start_lock`, so only one
+    worker runs `reflex init` at a time and the others then start from the
+    cache when it is enabled.
+
     Args:
         tmp_path_factory: pytest tmp_path_factory fixture
 
     Yields:
         running AppHarness instance
     """
-    with AppHarness.create(
-        root=tmp_path_factory.mktemp("event_chain"),
-        app_source=EventChain,  # type: ignore
-    ) as harness:
+    root = tmp_path_factory.mktemp("event_chain")
+    cached_app = get_cached_app()
+    if cached_app is not None and cached_app.exists():
+        harness = start_event_chain(root, cached_app)
+    else:
+        with cold_start_lock(tmp_path_factory):
+            # another worker may have cached the app while this one waited
+            harness = start_event_chain(root, cached_app)
+    try:
         yield harness
+    finally:
+        harness.stop()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def driver(event_chain: AppHarness) -> Generator[WebDriver, None, None]:
     """Get an instance of the browser open to the event_chain app.
 
+    The browser is shared by all tests in the module, see `reset_browser`.
+
     Args:
         event_chain: harness for EventChain app
 
@@ -280,6 +227,101 @@ def driver(event_chain: AppHarness) -> Generator[WebDriver, None, None]:
         driver.quit()
 
 
+@pytest.fixture(autouse=True)
+def reset_browser(driver: WebDriver) -> Generator[None, None, None]:
+    """Reset the shared browser after each test, so the next test gets a new client token.
+
+    Each test loads the page it needs itself. Clearing sessionStorage drops the
+    client token, so that page load gets a new token and an empty backend state.
+    Cookies are deleted too, and leaving the app for about:blank disconnects the
+    old client before the next test starts, without the cost of relaunching the
+    browser.
+
+    Args:
+        driver: the shared WebDriver instance
+
+    Yields:
+        None
+    """
+    yield
+    driver.execute_script("window.sessionStorage.clear();")
+    driver.delete_all_cookies()
+    driver.get("about:blank")
+
+
+def get_token_value(driver: WebDriver) -> Optional[str]:
+    """Read the value of the token input in a single WebDriver command.
+
+    Args:
+        driver: WebDriver instance.
+
+    Returns:
+        The token input value, or None if the input is not rendered yet.
+    """
+    return driver.execute_script(
+        "var token_input = document.getElementById('token'); "
+        "return token_input && token_input.value;"
+    )
+
+
+def poll_for_property(
+    element: WebElement,
+    name: str = "value",
+    timeout: Optional[float] = None,
+    exp_not_equal: str = "",
+) -> str:
+    """Poll a property of an already located element for change.
+
+    Unlike `AppHarness.poll_for_value`, this reads the DOM property instead of
+    the attribute, and the value seen by the last check is returned without
+    reading it again.
+
+    Args:
+        element: selenium webdriver element to check
+        name: the name of the property to poll
+        timeout: how long to poll the property
+        exp_not_equal: exit the polling loop when the property does not match
+
+    Returns:
+        The property value when the polling loop exited
+
+    Raises:
+        TimeoutError: when the timeout expires before the property changes
+    """
+    value = exp_not_equal
+
+    def _has_changed():
+        nonlocal value
+        value = element.get_property(name)
+        return value != exp_not_equal
+
+    if not AppHarness._poll_for(_has_changed, timeout=timeout):
+        raise TimeoutError(
+            f"{element} {name} remains {exp_not_equal!r} while polling.",
+        )
+    return value
+
+
+def click_by_id(driver: WebDriver, element_id: str):
+    """Find and click an element in a single WebDriver command.
+
+    The click is dispatched by javascript, so unlike WebElement.click it does not
+    check that the element is visible and not covered, e.g. by the connection
+    error banner. Only use it once the page has rendered, e.g. after reading
+    the token.
+
+    Args:
+        driver: WebDriver instance.
+        element_id: The ID of the element to click.
+    """
+    driver.execute_script(
+        "var element = document.getElementById(arguments[0]);"
+        "if (!element) throw new Error('No element with id ' + arguments[0]);"
+        "element.click();",
+        element_id,
+    )
+
+
 def assert_token(event_chain: AppHarness, driver: WebDriver) -> str:
     """Get the token associated with backend state.
 
@@ -291,129 +333,108 @@ def assert_token(event_chain: AppHarness, driver: WebDriver) -> str:
         The token visible in the driver browser.
     """
     assert event_chain.app_instance is not None
-    token_input = driver.find_element(By.ID, "token")
-    assert token_input
 
     # wait for the backend connection to send the token
-    token = event_chain.poll_for_value(token_input)
-    assert token is not None
+    token = AppHarness._poll_for(
+        lambda: get_token_value(driver), step=TOKEN_POLL_INTERVAL
+    )
+    assert token
 
     return f"{token}_state.state"
 
 
-@pytest.mark.parametrize(
-    ("button_id", "exp_event_order"),
-    [
-        ("return_event", ["click_return_event", "event_no_args"]),
-        (
-            "return_events",
-            ["click_return_events", "event_arg:7", "event_arg:8", "event_arg:9"],
-        ),
-        (
-            "yield_chain",
-            [
-                "click_yield_chain:0",
-                "click_yield_chain:1",
-                "click_yield_chain:2",
-                "click_yield_chain:3",
-                "event_arg:10",
-                "event_arg:11",
-                "event_arg:12",
-            ],
-        ),
-        (
-            "yield_many_events",
-            [
-                "click_yield_many_events",
-                "click_yield_many_events_done",
-                *[f"event_arg:{ix}" for ix in range(MANY_EVENTS)],
-            ],
-        ),
-        (
-            "yield_nested",
-            [
-                "click_yield_nested",
-                "event_nested_1",
-                "event_arg:yield_nested",
-                "event_nested_2",
-                "event_arg:nested_1",
-                "event_nested_3",
-                "event_arg:nested_2",
-                "event_no_args",
-                "event_arg:nested_3",
-            ],
-        ),
-        (
-            "redirect_return_chain",
-            [
-                "redirect_return_chain",
-                "on_load_return_chain",
-                "event_arg:1",
-                "event_arg:2",
-                "event_arg:3",
-            ],
-        ),
-        (
-            "redirect_yield_chain",
-            [
-                "redirect_yield_chain",
-                "on_load_yield_chain",
-                "event_arg:4",
-                "event_arg:5",
-                "event_arg:6",
-            ],
-        ),
-        (
-            "click_int_type",
-            ["event_arg_repr:1_int"],
-        ),
-        (
-            "click_dict_type",
-            ["event_arg_repr:{'a': 1}_dict"],
-        ),
-        (
-            "return_int_type",
-            ["click_return_int_type", "event_arg_repr:1_int"],
-        ),
-        (
-            "return_dict_type",
-            ["click_return_dict_type", "event_arg_repr:{'a': 1}_dict"],
-        ),
-    ],
-)
-@pytest.mark.asyncio
-async def test_event_chain_click(
+async def wait_for_event_order(
     event_chain: AppHarness,
-    driver: WebDriver,
-    button_id: str,
-    exp_event_order: list[str],
+    token: str,
+    expected_len: int,
+    timeout: Optional[float] = None,
+    step: float = EVENT_POLL_INTERVAL,
+    hydrated: bool = False,
+) -> BaseState:
+    """Wait until the backend state has recorded the expected number of events.
+
+    Returns as soon as the events arrive, the timeout is only a fallback for
+    when they never do.
+
+    Args:
+        event_chain: AppHarness for the event_chain app.
+        token: The backend state token.
+        expected_len: The number of events to wait for.
+        timeout: How long to wait for the events.
+        step: Interval between checks of the backend state.
+        hydrated: Also wait for the state to be hydrated, i.e. for the on_load
+            events of the page to be done.
+
+    Returns:
+        The backend state fetched by the last check.
+    """
+    backend_state: Optional[BaseState] = None
+
+    async def _has_all_events():
+        nonlocal backend_state
+        backend_state = (await event_chain.get_state(token)).substates["state"]
+        return len(backend_state.event_order) >= expected_len and (
+            backend_state.is_hydrated or not hydrated
+        )
+
+    await AppHarness._poll_for_async(_has_all_events, timeout=timeout, step=step)
+    assert backend_state is not None
+    return backend_state
+
+
+# the pages the redirect buttons navigate to (with next.js trailing slash)
+REDIRECT_PATHS = {
+    "redirect_return_chain": "/on-load-return-chain/",
+    "redirect_yield_chain": "/on-load-yield-chain/",
+}
+
+
+@pytest.mark.asyncio
+async def test_event_chain_click_all_buttons(
+    event_chain: AppHarness, driver: WebDriver
 ):
-    """Click the button, assert that the events are handled in the correct order.
+    """Click each button in turn, assert that the events are handled in the correct order.
+
+    All buttons are clicked with the same token, so the events of each click are
+    expected after the events recorded by the previous clicks.
 
     Args:
         event_chain: AppHarness for the event_chain app
         driver: selenium WebDriver open to the app
-        button_id: the ID of the button to click
-        exp_event_order: the expected events recorded in the State
     """
+    assert event_chain.frontend_url is not None
+    driver.get(event_chain.frontend_url)
     token = assert_token(event_chain, driver)
-    btn = driver.find_element(By.ID, button_id)
-    btn.click()
 
-    async def _has_all_events():
-        return len(
-            (await event_chain.get_state(token)).substates["state"].event_order
-        ) == len(exp_event_order)
+    prev_len = 0
+    for button_id, exp_event_order in CLICK_EVENT_ORDERS:
+        if exp_event_order is None:
+            exp_event_order = many_events_order()
+        click_by_id(driver, button_id)
+
+        backend_state = await wait_for_event_order(
+            event_chain, token, prev_len + len(exp_event_order)
+        )
+        assert backend_state.event_order[prev_len:] == exp_event_order, button_id
+        prev_len = len(backend_state.event_order)
 
-    await AppHarness._poll_for_async(_has_all_events)
-    event_order = (await event_chain.get_state(token)).substates["state"].event_order
-    assert event_order == exp_event_order
+        if button_id in REDIRECT_PATHS:
+            exp_path = REDIRECT_PATHS[button_id]
+            assert AppHarness._poll_for(
+                lambda exp_path=exp_path: urlsplit(driver.current_url).path == exp_path,
+                timeout=2,
+                step=REDIRECT_POLL_INTERVAL,
+            ), f"{button_id} did not redirect to {exp_path}"
+            # return to the index page for the next button
+            driver.get(event_chain.frontend_url)
+            assert assert_token(event_chain, driver) == token
 
 
 @pytest.mark.parametrize(
-    ("uri", "exp_event_order"),
+    ("kind", "trigger", "exp_event_order"),
     [
         (
+            "on_load",
             "/on-load-return-chain",
             [
                 "on_load_return_chain",
@@ -423,6 +444,7 @@ async def test_event_chain_click(
             ],
         ),
         (
+            "on_load",
             "/on-load-yield-chain",
             [
                 "on_load_yield_chain",
@@ -431,42 +453,8 @@ async def test_event_chain_click(
                 "event_arg:6",
             ],
         ),
-    ],
-)
-@pytest.mark.asyncio
-async def test_event_chain_on_load(
-    event_chain: AppHarness,
-    driver: WebDriver,
-    uri: str,
-    exp_event_order: list[str],
-):
-    """Load the URI, assert that the events are handled in the correct order.
-
-    Args:
-        event_chain: AppHarness for the event_chain app
-        driver: selenium WebDriver open to the app
-        uri: the page to load
-        exp_event_order: the expected events recorded in the State
-    """
-    assert event_chain.frontend_url is not None
-    driver.get(event_chain.frontend_url + uri)
-    token = assert_token(event_chain, driver)
-
-    async def _has_all_events():
-        return len(
-            (await event_chain.get_state(token)).substates["state"].event_order
-        ) == len(exp_event_order)
-
-    await AppHarness._poll_for_async(_has_all_events)
-    backend_state = (await event_chain.get_state(token)).substates["state"]
-    assert backend_state.event_order == exp_event_order
-    assert backend_state.is_hydrated is True
-
-
-@pytest.mark.parametrize(
-    ("uri", "exp_event_order"),
-    [
         (
+            "on_mount",
             "/on-mount-return-chain",
             [
                 "on_load_return_chain",
@@ -482,6 +470,7 @@ async def test_event_chain_on_load(
             ],
         ),
         (
+            "on_mount",
             "/on-mount-yield-chain",
             [
                 "on_load_yield_chain",
@@ -501,41 +490,47 @@ async def test_event_chain_on_load(
     ],
 )
 @pytest.mark.asyncio
-async def test_event_chain_on_mount(
+async def test_event_chain(
     event_chain: AppHarness,
     driver: WebDriver,
-    uri: str,
+    kind: str,
+    trigger: str,
     exp_event_order: list[str],
 ):
-    """Load the URI, assert that the events are handled in the correct order.
+    """Load the page, assert that the events are handled in the correct order.
+
+    The `kind` of each case determines how the events are triggered:
 
-    These pages use `on_mount` and `on_unmount`, which get fired twice in dev mode
-    due to react StrictMode being used.
+    * on_load: load the `trigger` URI.
+    * on_mount: load the `trigger` URI, then click the unmount button.
+
+    The on_mount pages use `on_mount` and `on_unmount`, which get fired twice in
+    dev mode due to react StrictMode being used.
 
     In prod mode, these events are only fired once.
 
     Args:
         event_chain: AppHarness for the event_chain app
         driver: selenium WebDriver open to the app
-        uri: the page to load
+        kind: how the events are triggered, "on_load" or "on_mount"
+        trigger: the page to load
         exp_event_order: the expected events recorded in the State
     """
     assert event_chain.frontend_url is not None
-    driver.get(event_chain.frontend_url + uri)
+    driver.get(event_chain.frontend_url + trigger)
     token = assert_token(event_chain, driver)
 
-    unmount_button = driver.find_element(By.ID, "unmount")
-    assert unmount_button
-    unmount_button.click()
-
-    async def _has_all_events():
-        return len(
-            (await event_chain.get_state(token)).substates["state"].event_order
-        ) == len(exp_event_order)
+    if kind == "on_mount":
+        # the unmount button redirects to the index page, which keeps the same
+        # token, so the unmount events are recorded in the same state
+        click_by_id(driver, "unmount")
 
-    await AppHarness._poll_for_async(_has_all_events)
-    event_order = (await event_chain.get_state(token)).substates["state"].event_order
-    assert event_order == exp_event_order
+    backend_state = await wait_for_event_order(
+        event_chain, token, len(exp_event_order), hydrated=kind == "on_load"
+    )
+    assert backend_state.event_order == exp_event_order
+    if kind == "on_load":
+        assert backend_state.is_hydrated is True
 
 
 @pytest.mark.parametrize(
@@ -553,15 +548,12 @@ def test_yield_state_update(event_chain: AppHarness, driver: WebDriver, button_i
         driver: selenium WebDriver open to the app
         button_id: the ID of the button to click
     """
+    assert event_chain.frontend_url is not None
+    driver.get(event_chain.frontend_url)
     interim_value_input = driver.find_element(By.ID, "interim_value")
     assert_token(event_chain, driver)
 
     btn = driver.find_element(By.ID, button_id)
     btn.click()
-    assert (
-        event_chain.poll_for_value(interim_value_input, exp_not_equal="") == "interim"
-    )
-    assert (
-        event_chain.poll_for_value(interim_value_input, exp_not_equal="interim")
-        == "final"
-    )
+    assert poll_for_property(interim_value_input, exp_not_equal="") == "interim"
+    assert poll_for_property(interim_value_input, exp_not_equal="interim") == "final"
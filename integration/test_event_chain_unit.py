@@ -0,0 +1,109 @@
+"""Ensure that Event Chains are handled in order by the backend, without a browser.
+
+The frontend event queue is emulated in-process, so the event ordering of the
+click handlers can be checked without compiling or serving the app. The
+browser tests in test_event_chain.py remain the end to end check.
+"""
+from __future__ import annotations
+
+import collections
+import sys
+import types
+import uuid
+from typing import Generator
+
+import pytest
+
+import reflex as rx
+from reflex.app import process
+from reflex.event import Event
+from reflex.state import StateManagerRedis
+from reflex.testing import AppHarness
+
+from .event_chain_app import CLICK_EVENT_ORDERS, EventChain, many_events_order
+
+
+@pytest.fixture(scope="module")
+def event_chain_module() -> Generator[types.ModuleType, None, None]:
+    """Load the EventChain app module in-process.
+
+    The app source is prepared the same way AppHarness writes it to disk, so the
+    State class is defined at the top level of the module, as it is when served.
+    The module is registered in sys.modules while the tests run, because event
+    handler names are resolved through the module of the handler. The substates
+    of rx.State are restored afterwards, so the State of a harness running in the
+    same session is not replaced.
+
+    Yields:
+        The EventChain app module.
+    """
+    module = types.ModuleType(f"{EventChain.__name__.lower()}_unit")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(rx.State, "class_subclasses", rx.State.class_subclasses.copy())
+        mp.setitem(sys.modules, module.__name__, module)
+        rx.State.get_class_substate.cache_clear()
+        try:
+            exec(AppHarness._get_source_from_app_source(EventChain), module.__dict__)
+            yield module
+        finally:
+            rx.State.get_class_substate.cache_clear()
+
+
+async def process_event_chain(app, event: Event):
+    """Process an event and every event it chains, like the frontend queue does.
+
+    Events are handled one at a time in the order they were queued. Events for
+    the frontend itself, such as console_log, are skipped.
+
+    Args:
+        app: The app to process the events for.
+        event: The first event to process.
+    """
+    queue = collections.deque([event])
+    while queue:
+        event = queue.popleft()
+        if event.name.startswith("_"):
+            continue
+        # the frontend adds the router data to every event it sends
+        event.router_data = {"pathname": "/", "query": {}, "asPath": "/"}
+        async for update in process(app, event, "mock_sid", {}, "127.0.0.1"):
+            queue.extend(update.events)
+
+
+@pytest.mark.parametrize(
+    ("button_id", "handler"),
+    [
+        ("return_event", "click_return_event"),
+        ("return_events", "click_return_events"),
+        ("yield_chain", "click_yield_chain"),
+        ("yield_many_events", "click_yield_many_events"),
+        ("yield_nested", "click_yield_nested"),
+        ("return_int_type", "click_return_int_type"),
+        ("return_dict_type", "click_return_dict_type"),
+    ],
+)
+@pytest.mark.asyncio
+async def test_event_chain_process(
+    event_chain_module: types.ModuleType, button_id: str, handler: str
+):
+    """Process the handler of a button, assert that the events are handled in the correct order.
+
+    Args:
+        event_chain_module: the EventChain app module
+        button_id: the ID of the button in the EventChain app
+        handler: the name of the event handler the button triggers
+    """
+    exp_event_order = dict(CLICK_EVENT_ORDERS)[button_id] or many_events_order()
+    app = event_chain_module.app
+    state_name = event_chain_module.State.get_full_name()
+    token = str(uuid.uuid4())
+
+    try:
+        await process_event_chain(
+            app, Event(token=token, name=f"{state_name}.{handler}", payload={})
+        )
+        state = await app.state_manager.get_state(f"{token}_{state_name}")
+        assert state.substates["state"].event_order == exp_event_order
+    finally:
+        if isinstance(app.state_manager, StateManagerRedis):
+            await app.state_manager.close()
@@ -184,7 +184,8 @@ class AppHarness:
         glbs.update(overrides)
         return glbs
 
-    def _get_source_from_app_source(self, app_source: Any) -> str:
+    @staticmethod
+    def _get_source_from_app_source(app_source: Any) -> str:
         """Get the source from app_source.
 
         Args: